@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional
@@ -21,6 +22,10 @@ from typing import TYPE_CHECKING, List, Optional
 if TYPE_CHECKING:
     from .test import Test
 
+# Slotted dataclass instances carry no per-instance __dict__, which matters for TestRun since scenarios
+# instantiate one per test; the `slots` argument only exists on Python 3.10+.
+_SLOTS_IF_SUPPORTED = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class TestDependency:
     """
@@ -42,7 +47,7 @@ class TestDependency:
         self.test_run = test_run
 
 
-@dataclass
+@dataclass(**_SLOTS_IF_SUPPORTED)
 class TestRun:
     __test__ = False
 
@@ -58,9 +63,16 @@ class TestRun:
     weight: float = 0.0
     ideal_perf: float = 1.0
     dependencies: dict[str, TestDependency] = field(default_factory=dict)
+    _cached_hash: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The hashed fields are effectively immutable after construction, so compute the hash once.
+        self._cached_hash = hash(
+            (self.name, self.test.name, self.num_nodes, tuple(self.nodes), self.iterations, self.time_limit)
+        )
 
     def __hash__(self) -> int:
-        return hash(self.name + self.test.name + str(self.iterations) + str(self.current_iteration))
+        return self._cached_hash
 
     def has_more_iterations(self) -> bool:
         """
@@ -109,15 +121,15 @@ class TestScenario:
 
     def pretty_print(self) -> str:
         """Print each test in the scenario along with its section name, description, and visualized dependencies."""
-        s = f"Test Scenario: {self.name}\n"
+        parts = [f"Test Scenario: {self.name}\n"]
         for tr in self.test_runs:
-            s += f"\nSection Name: {tr.name}\n"
-            s += f"  Test Name: {tr.test.name}\n"
-            s += f"  Description: {tr.test.description}\n"
+            parts.append(f"\nSection Name: {tr.name}\n")
+            parts.append(f"  Test Name: {tr.test.name}\n")
+            parts.append(f"  Description: {tr.test.description}\n")
             if tr.dependencies:
                 for dep_type, dependency in tr.dependencies.items():
                     if dependency:
-                        s += f"  {dep_type.replace('_', ' ').title()}: {dependency.test_run.name}"
+                        parts.append(f"  {dep_type.replace('_', ' ').title()}: {dependency.test_run.name}")
             else:
-                s += "  No dependencies"
-        return s
+                parts.append("  No dependencies")
+        return "".join(parts)
@@ -15,9 +15,12 @@
 # limitations under the License.
 
 import logging
+from typing import cast
 
 from cloudai import BaseRunner, JobIdRetrievalError, System, TestRun, TestScenario
+from cloudai.systems import SlurmSystem
 from cloudai.util import CommandShell
+from cloudai.util.docker_image_cache_manager import DockerImageCacheManager
 
 from .slurm_job import SlurmJob
 
@@ -41,6 +44,26 @@ class SlurmRunner(BaseRunner):
         """
         super().__init__(mode, system, test_scenario)
         self.cmd_shell = CommandShell()
+        if self.mode == "run":
+            self._ensure_docker_images()
+
+    def _ensure_docker_images(self) -> None:
+        """
+        Resolve the Docker images for the whole test scenario up front.
+
+        Each unique image is checked (and cached, if configured) exactly once before any job is submitted;
+        the per-test-run lookups performed during command generation are then served from the memoized
+        results. Failures are logged here and surfaced by the per-test-run checks as before.
+        """
+        slurm_system = cast(SlurmSystem, self.system)
+        cache_manager = DockerImageCacheManager(
+            slurm_system.install_path,
+            slurm_system.cache_docker_images_locally,
+            slurm_system.default_partition,
+        )
+        for (docker_image_url, _, _), result in cache_manager.ensure_images_for_scenario(self.test_scenario).items():
+            if not result.success:
+                logging.warning(f"Failed to ensure Docker image {docker_image_url}: {result.message}")
 
     def _submit_test(self, tr: TestRun) -> SlurmJob:
         """
@@ -14,36 +14,249 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import base64
+import json
 import logging
+import netrc
 import os
+import re
 import shutil
 import subprocess
-import tempfile
+import urllib.error
+import urllib.parse
+import urllib.request
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Set, Tuple
 
+if TYPE_CHECKING:
+    from cloudai import TestScenario
 
-class PrerequisiteCheckResult:
+# Maximum number of Docker images resolved concurrently by ensure_images_for_scenario.
+_MAX_CONCURRENT_IMAGE_CHECKS = 16
+
+# Default registry and manifest media types used when probing image accessibility via the
+# Docker registry HTTP API.
+_DEFAULT_REGISTRY = "registry-1.docker.io"
+_MANIFEST_ACCEPT_HEADER = ", ".join(
+    [
+        "application/vnd.docker.distribution.manifest.v2+json",
+        "application/vnd.docker.distribution.manifest.list.v2+json",
+        "application/vnd.oci.image.manifest.v1+json",
+        "application/vnd.oci.image.index.v1+json",
+    ]
+)
+
+
+def _parse_docker_image_url(docker_image_url: str) -> Tuple[str, str, str]:
+    """
+    Split a Docker image URL into its registry, repository, and reference parts.
+
+    Args:
+        docker_image_url (str): URL of the Docker image, e.g. "nvcr.io/nvidia/pytorch:24.02".
+
+    Returns:
+        Tuple[str, str, str]: Registry host, repository name, and tag or digest.
+    """
+    reference = docker_image_url.split("://", 1)[-1]
+
+    registry, _, remainder = reference.partition("/")
+    if not remainder or ("." not in registry and ":" not in registry and registry != "localhost"):
+        registry, remainder = _DEFAULT_REGISTRY, reference
+    if registry in ("docker.io", "index.docker.io"):
+        registry = _DEFAULT_REGISTRY
+
+    if "@" in remainder:
+        repository, _, tag = remainder.partition("@")
+    else:
+        repository, _, tag = remainder.partition(":")
+    if "/" not in repository and registry == _DEFAULT_REGISTRY:
+        repository = f"library/{repository}"
+
+    return registry, repository, tag or "latest"
+
+
+def _head_manifest(manifest_url: str, token: str = "") -> Tuple[int, str]:
+    """
+    Issue a HEAD request against a registry manifest URL.
+
+    Args:
+        manifest_url (str): Full URL of the image manifest.
+        token (str): Optional Bearer token to authorize the request.
+
+    Returns:
+        Tuple[int, str]: HTTP status code and any Www-Authenticate challenge on 401.
+    """
+    headers = {"Accept": _MANIFEST_ACCEPT_HEADER}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    request = urllib.request.Request(manifest_url, headers=headers, method="HEAD")
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, ""
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers.get("Www-Authenticate", "")
+
+
+def _enroot_credentials_path() -> Path:
+    """Return the path of the enroot credentials file, honoring ENROOT_CONFIG_PATH."""
+    config_dir = os.environ.get("ENROOT_CONFIG_PATH", "")
+    if config_dir:
+        return Path(config_dir) / ".credentials"
+    return Path.home() / ".config" / "enroot" / ".credentials"
+
+
+def _registry_credentials(host: str) -> Optional[Tuple[str, str]]:
+    """
+    Read the enroot credentials configured for a host.
+
+    The enroot credentials file uses the netrc format, e.g.
+    "machine nvcr.io login $oauthtoken password <API key>" as described in the README.
+
+    Args:
+        host (str): Host name to look up, e.g. "nvcr.io".
+
+    Returns:
+        Optional[Tuple[str, str]]: Login and password for the host, or None if not configured.
+    """
+    credentials_path = _enroot_credentials_path()
+    if not credentials_path.is_file():
+        return None
+    try:
+        authenticator = netrc.netrc(str(credentials_path)).authenticators(host.partition(":")[0])
+    except (netrc.NetrcParseError, OSError):
+        return None
+    if authenticator is None:
+        return None
+    login, _, password = authenticator
+    if not login or not password:
+        return None
+    return login, password
+
+
+def _fetch_bearer_token(challenge: str, repository: str, registry: str = "") -> str:
     """
-    Class representing the result of a prerequisite check.
+    Follow a Bearer challenge from the registry and fetch a pull token.
+
+    When enroot credentials are configured for the token realm host (or the registry host), they are sent
+    as HTTP Basic auth so that tokens for private repositories carry the proper grants; otherwise an
+    anonymous token is requested.
+
+    Args:
+        challenge (str): The Www-Authenticate header value from the 401 response.
+        repository (str): Repository name to request pull scope for.
+        registry (str): Registry host, used as a fallback for the credentials lookup.
+
+    Returns:
+        str: The token, or an empty string if it could not be obtained.
+    """
+    if not challenge.startswith("Bearer"):
+        return ""
+    fields = dict(re.findall(r'(\w+)="([^"]*)"', challenge))
+    realm = fields.get("realm", "")
+    if not realm:
+        return ""
+
+    params = {"scope": f"repository:{repository}:pull"}
+    if "service" in fields:
+        params["service"] = fields["service"]
+    token_url = f"{realm}?{urllib.parse.urlencode(params)}"
+
+    headers = {}
+    realm_host = urllib.parse.urlparse(realm).netloc
+    credentials = _registry_credentials(realm_host) or (_registry_credentials(registry) if registry else None)
+    if credentials:
+        login, password = credentials
+        basic = base64.b64encode(f"{login}:{password}".encode()).decode()
+        headers["Authorization"] = f"Basic {basic}"
+
+    request = urllib.request.Request(token_url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            payload = json.loads(response.read().decode())
+    except (urllib.error.URLError, OSError, ValueError):
+        return ""
+    return payload.get("token", payload.get("access_token", ""))
+
+
+@lru_cache(maxsize=None)
+def _which(binary: str) -> Optional[str]:
+    """Locate a binary on PATH, caching the result since PATH does not change during a run."""
+    return shutil.which(binary)
+
+
+@lru_cache(maxsize=256)
+def _check_docker_image_exists(
+    install_path: Path,
+    cache_docker_images_locally: bool,
+    docker_image_url: str,
+    subdir_name: str,
+    docker_image_filename: str,
+) -> Tuple[bool, Path, str]:
+    """
+    Check if the Docker image exists, memoizing results per argument tuple.
+
+    Repeated identical queries across test runs short-circuit to a dict lookup instead of re-statting the
+    filesystem. The memo is cleared by the mutating methods of DockerImageCacheManager.
+
+    Args:
+        install_path (Path): The base installation path.
+        cache_docker_images_locally (bool): Whether Docker image files are cached locally.
+        docker_image_url (str): URL or file path of the Docker image.
+        subdir_name (str): Subdirectory name within the installation path.
+        docker_image_filename (str): Docker image filename.
+
+    Returns:
+        Tuple[bool, Path, str]: Success flag, Docker image path, and message.
+    """
+    # If not caching locally, return True. Defer checking URL accessibility to srun.
+    if not cache_docker_images_locally:
+        return True, Path(docker_image_url), ""
+
+    docker_image_path = Path(docker_image_url)
+    if docker_image_path.is_file():
+        return True, docker_image_path.absolute(), f"Docker image file path is valid: {docker_image_url}."
+
+    # Check if the cache file exists
+    if not install_path.exists():
+        message = f"Install path {install_path} does not exist."
+        logging.debug(message)
+        return False, Path(), message
+
+    # Building the path with one string format parses it once, instead of per "/" join.
+    docker_image_path = Path(f"{install_path}/{subdir_name}/{docker_image_filename}")
+    subdir_path = docker_image_path.parent
+    if not subdir_path.exists():
+        message = f"Subdirectory path {subdir_path} does not exist."
+        logging.debug(message)
+        return False, Path(), message
+    if docker_image_path.is_file():
+        message = f"Cached Docker image already exists at {docker_image_path}."
+        logging.debug(message)
+        return True, docker_image_path.absolute(), message
+
+    message = f"Docker image does not exist at the specified path: {docker_image_path}."
+    logging.debug(message)
+    return False, Path(), message
+
+
+class PrerequisiteCheckResult(NamedTuple):
+    """
+    Result of a prerequisite check.
+
+    NamedTuple keeps instances as plain tuples, which are cheaper to allocate than class instances
+    carrying a __dict__; one is created per check on the caching hot path.
 
     Attributes
         success (bool): Indicates whether the prerequisite check was successful.
         message (str): A message providing additional information about the result.
     """
 
-    def __init__(self, success: bool, message: str = "") -> None:
-        """
-        Initialize the PrerequisiteCheckResult.
-
-        Args:
-            success (bool): Indicates whether the prerequisite check was successful.
-            message (str): A message providing additional information about the result.
-        """
-        self.success = success
-        self.message = message
+    success: bool
+    message: str = ""
 
-    def __bool__(self):
+    def __bool__(self) -> bool:
         """
         Return the success status as a boolean.
 
@@ -52,7 +265,7 @@ class PrerequisiteCheckResult:
         """
         return self.success
 
-    def __str__(self):
+    def __str__(self) -> str:
         """
         Return the message as a string.
 
@@ -62,9 +275,9 @@ class PrerequisiteCheckResult:
         return self.message
 
 
-class DockerImageCacheResult:
+class DockerImageCacheResult(NamedTuple):
     """
-    Class representing the result of a Docker image caching operation.
+    Result of a Docker image caching operation.
 
     Attributes
         success (bool): Indicates whether the operation was successful.
@@ -72,20 +285,11 @@ class DockerImageCacheResult:
         message (str): A message providing additional information about the result.
     """
 
-    def __init__(self, success: bool, docker_image_path: Optional[Path] = None, message: str = "") -> None:
-        """
-        Initialize the DockerImageCacheResult.
+    success: bool
+    docker_image_path: Optional[Path] = None
+    message: str = ""
 
-        Args:
-            success (bool): Indicates whether the operation was successful.
-            docker_image_path (Path): The path to the Docker image.
-            message (str): A message providing additional information about the result.
-        """
-        self.success = success
-        self.docker_image_path = docker_image_path
-        self.message = message
-
-    def __bool__(self):
+    def __bool__(self) -> bool:
         """
         Return the success status as a boolean.
 
@@ -94,7 +298,7 @@ class DockerImageCacheResult:
         """
         return self.success
 
-    def __str__(self):
+    def __str__(self) -> str:
         """
         Return the message as a string.
 
@@ -118,6 +322,25 @@ class DockerImageCacheManager:
         self.install_path = install_path
         self.cache_docker_images_locally = cache_docker_images_locally
         self.partition_name = partition_name
+        # Fixed argv prefix for enroot imports; partition_name never changes after construction, so the
+        # prefix is built once and only the output path and image URL are spliced in per call.
+        self._srun_prefix = ("srun", "--export=ALL", f"--partition={partition_name}", "enroot", "import", "-o")
+
+    def _cached_image_path(self, subdir_name: str, docker_image_filename: str) -> Path:
+        """
+        Build the path of a cached Docker image file.
+
+        A single string format parses the path once instead of once per "/" join; install paths are
+        always absolute POSIX paths, so the result is identical.
+
+        Args:
+            subdir_name (str): Subdirectory name within the installation path.
+            docker_image_filename (str): Docker image filename.
+
+        Returns:
+            Path: Path of the cached Docker image file.
+        """
+        return Path(f"{self.install_path}/{subdir_name}/{docker_image_filename}")
 
     def ensure_docker_image(
         self, docker_image_url: str, subdir_name: str, docker_image_filename: str
@@ -142,6 +365,61 @@ class DockerImageCacheManager:
 
         return image_check_result
 
+    def ensure_images_for_scenario(
+        self, test_scenario: "TestScenario"
+    ) -> Dict[Tuple[str, str, str], DockerImageCacheResult]:
+        """
+        Ensure the Docker images for all test runs in a scenario, resolving each unique image only once.
+
+        Many test runs commonly reference the same Docker image; collecting the unique
+        (docker_image_url, subdir_name, docker_image_filename) triples up front avoids repeating the existence
+        check and accessibility probe per test run. The unique images are resolved concurrently since the
+        accessibility probe is network-bound.
+
+        This method starts its own event loop via asyncio.run, so it must be called before entering an
+        event loop (as the slurm runner does) rather than from within one.
+
+        Args:
+            test_scenario (TestScenario): Test scenario whose Docker images should be ensured.
+
+        Returns:
+            Dict[Tuple[str, str, str], DockerImageCacheResult]: Result per unique image triple.
+
+        Raises:
+            RuntimeError: If called from a running event loop.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "ensure_images_for_scenario starts its own event loop via asyncio.run and cannot be "
+                "called from a running event loop; call it before entering the loop instead."
+            )
+
+        image_triples: Set[Tuple[str, str, str]] = set()
+        for tr in test_scenario.test_runs:
+            install_strategy = tr.test.test_template.install_strategy
+            docker_image_url = getattr(install_strategy, "docker_image_url", "")
+            subdir_name = getattr(install_strategy, "SUBDIR_PATH", "")
+            docker_image_filename = getattr(install_strategy, "DOCKER_IMAGE_FILENAME", "")
+            if docker_image_url and subdir_name and docker_image_filename:
+                image_triples.add((docker_image_url, subdir_name, docker_image_filename))
+
+        triples = sorted(image_triples)
+
+        async def ensure_all() -> List[DockerImageCacheResult]:
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_IMAGE_CHECKS)
+
+            async def ensure_one(triple: Tuple[str, str, str]) -> DockerImageCacheResult:
+                async with semaphore:
+                    return await asyncio.to_thread(self.ensure_docker_image, *triple)
+
+            return await asyncio.gather(*(ensure_one(triple) for triple in triples))
+
+        return dict(zip(triples, asyncio.run(ensure_all())))
+
     def check_docker_image_exists(
         self, docker_image_url: str, subdir_name: str, docker_image_filename: str
     ) -> DockerImageCacheResult:
@@ -162,37 +440,10 @@ class DockerImageCacheManager:
             f"cache_docker_images_locally={self.cache_docker_images_locally}"
         )
 
-        # If not caching locally, return True. Defer checking URL accessibility to srun.
-        if not self.cache_docker_images_locally:
-            return DockerImageCacheResult(True, Path(docker_image_url), "")
-
-        docker_image_path = Path(docker_image_url)
-        if docker_image_path.is_file() and docker_image_path.exists():
-            return DockerImageCacheResult(
-                True, docker_image_path.absolute(), f"Docker image file path is valid: {docker_image_url}."
-            )
-
-        # Check if the cache file exists
-        if not self.install_path.exists():
-            message = f"Install path {self.install_path} does not exist."
-            logging.debug(message)
-            return DockerImageCacheResult(False, Path(), message)
-
-        subdir_path = self.install_path / subdir_name
-        if not subdir_path.exists():
-            message = f"Subdirectory path {subdir_path} does not exist."
-            logging.debug(message)
-            return DockerImageCacheResult(False, Path(), message)
-
-        docker_image_path = subdir_path / docker_image_filename
-        if docker_image_path.is_file() and docker_image_path.exists():
-            message = f"Cached Docker image already exists at {docker_image_path}."
-            logging.debug(message)
-            return DockerImageCacheResult(True, docker_image_path.absolute(), message)
-
-        message = f"Docker image does not exist at the specified path: {docker_image_path}."
-        logging.debug(message)
-        return DockerImageCacheResult(False, Path(), message)
+        success, docker_image_path, message = _check_docker_image_exists(
+            self.install_path, self.cache_docker_images_locally, docker_image_url, subdir_name, docker_image_filename
+        )
+        return DockerImageCacheResult(success, docker_image_path, message)
 
     def cache_docker_image(
         self, docker_image_url: str, subdir_name: str, docker_image_filename: str
@@ -200,6 +451,9 @@ class DockerImageCacheManager:
         """
         Cache the Docker image locally using enroot import.
 
+        Callers are expected to go through ensure_docker_image, which already handles the cached fast path;
+        this method does not re-check whether the image file exists.
+
         Args:
             docker_image_url (str): URL of the Docker image.
             subdir_name (str): Subdirectory name within the installation path.
@@ -208,13 +462,10 @@ class DockerImageCacheManager:
         Returns:
             DockerImageCacheResult: Result of the Docker image caching operation.
         """
-        subdir_path = self.install_path / subdir_name
-        docker_image_path = subdir_path / docker_image_filename
+        _check_docker_image_exists.cache_clear()
 
-        if docker_image_path.is_file():
-            success_message = f"Cached Docker image already exists at {docker_image_path}."
-            logging.info(success_message)
-            return DockerImageCacheResult(True, docker_image_path.absolute(), success_message)
+        docker_image_path = self._cached_image_path(subdir_name, docker_image_filename)
+        subdir_path = docker_image_path.parent
 
         prerequisite_check = self._check_prerequisites(docker_image_url)
         if not prerequisite_check:
@@ -231,26 +482,24 @@ class DockerImageCacheManager:
             logging.error(error_message)
             return DockerImageCacheResult(False, Path(), error_message)
 
-        if not subdir_path.exists():
-            try:
-                subdir_path.mkdir(parents=True)
-            except OSError as e:
-                error_message = f"Failed to create subdirectory {subdir_path}. Error: {e}"
-                logging.error(error_message)
-                return DockerImageCacheResult(False, Path(), error_message)
+        try:
+            subdir_path.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            error_message = f"Failed to create subdirectory {subdir_path}. Error: {e}"
+            logging.error(error_message)
+            return DockerImageCacheResult(False, Path(), error_message)
 
-        enroot_import_cmd = (
-            f"srun --export=ALL --partition={self.partition_name} "
-            f"enroot import -o {docker_image_path} docker://{docker_image_url}"
-        )
-        logging.debug(f"Importing Docker image: {enroot_import_cmd}")
+        # Passing an argv list avoids spawning an intermediate shell and re-parsing the command line.
+        enroot_import_cmd = [*self._srun_prefix, str(docker_image_path), f"docker://{docker_image_url}"]
+        enroot_import_cmd_str = " ".join(enroot_import_cmd)
+        logging.debug(f"Importing Docker image: {enroot_import_cmd_str}")
 
         try:
-            p = subprocess.run(enroot_import_cmd, shell=True, check=True, capture_output=True, text=True)
+            p = subprocess.run(enroot_import_cmd, check=True, capture_output=True, text=True)
 
             if "Disk quota exceeded" in p.stderr or "Write error" in p.stderr:
                 error_message = (
-                    f"Failed to cache Docker image {docker_image_url}. Command: {enroot_import_cmd}. "
+                    f"Failed to cache Docker image {docker_image_url}. Command: {enroot_import_cmd_str}. "
                     f"Error: '{p.stderr}'\n\n"
                     "This error indicates a disk-related issue. Please check if the disk is full or not usable. "
                     "If the disk is full, consider using a different disk or removing unnecessary files."
@@ -260,11 +509,11 @@ class DockerImageCacheManager:
 
             success_message = f"Docker image cached successfully at {docker_image_path}."
             logging.debug(success_message)
-            logging.debug(f"Command used: {enroot_import_cmd}, stdout: {p.stdout}, stderr: {p.stderr}")
+            logging.debug(f"Command used: {enroot_import_cmd_str}, stdout: {p.stdout}, stderr: {p.stderr}")
             return DockerImageCacheResult(True, docker_image_path.absolute(), success_message)
         except subprocess.CalledProcessError as e:
             error_message = (
-                f"Failed to import Docker image from {docker_image_url}. Command: {enroot_import_cmd}. Error: {e}"
+                f"Failed to import Docker image from {docker_image_url}. Command: {enroot_import_cmd_str}. Error: {e}"
             )
             logging.error(error_message)
             return DockerImageCacheResult(
@@ -272,7 +521,7 @@ class DockerImageCacheManager:
                 Path(),
                 (
                     f"Failed to import Docker image from {docker_image_url}. "
-                    f"Command: {enroot_import_cmd}. "
+                    f"Command: {enroot_import_cmd_str}. "
                     f"Error: {e}. Please check the Docker image URL and ensure that it is accessible and set up with "
                     f"valid credentials."
                 ),
@@ -289,7 +538,7 @@ class DockerImageCacheManager:
             PrerequisiteCheckResult: Result of the prerequisite check.
         """
         required_binaries = ["enroot", "srun"]
-        missing_binaries = [binary for binary in required_binaries if not shutil.which(binary)]
+        missing_binaries = [binary for binary in required_binaries if not _which(binary)]
 
         if missing_binaries:
             missing_binaries_str = ", ".join(missing_binaries)
@@ -309,70 +558,53 @@ class DockerImageCacheManager:
         """
         Check if the Docker image URL is accessible.
 
+        A HEAD request against the registry manifest confirms reachability without launching enroot or
+        transferring any image layers. A 401 challenge is followed once to obtain a pull token, using the
+        enroot credentials configured for the registry when available.
+
         Args:
             docker_image_url (str): URL of the Docker image.
 
         Returns:
             PrerequisiteCheckResult: Result of the Docker image accessibility check.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            docker_image_path = Path(temp_dir) / "docker_image.sqsh"
-            enroot_import_cmd = f"enroot import -o {docker_image_path} docker://{docker_image_url}"
+        registry, repository, tag = _parse_docker_image_url(docker_image_url)
+        manifest_url = f"https://{registry}/v2/{repository}/manifests/{tag}"
 
-            logging.debug(f"Checking Docker image accessibility: {enroot_import_cmd}")
+        logging.debug(f"Checking Docker image accessibility: HEAD {manifest_url}")
 
-            process = subprocess.Popen(enroot_import_cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            try:
-                while True:
-                    error_output = process.stderr.readline() if process.stderr else None
-                    error_output = error_output.decode() if error_output else ""
-
-                    if error_output:
-                        if (
-                            "Downloading" in error_output
-                            or "Found all layers in cache" in error_output
-                            or "Fetching image manifest list" in error_output
-                        ):
-                            logging.debug(
-                                f"Docker image URL, {docker_image_url}, is accessible. "
-                                f"Command used: {enroot_import_cmd}. Found keyword: {error_output.strip()}"
-                            )
-                            process.terminate()
-                            return PrerequisiteCheckResult(
-                                True, f"Docker image URL, {docker_image_url}, is accessible."
-                            )
-                        if "[ERROR]" in error_output:
-                            logging.error(
-                                f"Failed to access Docker image URL, {docker_image_url}. "
-                                f"Command used: {enroot_import_cmd}. Error: {error_output}"
-                            )
-                            process.terminate()
-                            if "401 Unauthorized" in error_output:
-                                detailed_message = (
-                                    f"Failed to access Docker image URL: {docker_image_url}. Error: {error_output}\n"
-                                    "This error indicates that access to the Docker image URL is unauthorized. "
-                                    "Please ensure you have the necessary permissions and have followed the "
-                                    "instructions in the README for setting up your credentials correctly."
-                                )
-                                return PrerequisiteCheckResult(False, detailed_message)
-                            return PrerequisiteCheckResult(
-                                False, f"Failed to access Docker image URL: {docker_image_url}. Error: {error_output}"
-                            )
-                    if process.poll() is not None:
-                        break
-
-                logging.debug(f"Failed to access Docker image URL: {docker_image_url}. Unknown error.")
-                return PrerequisiteCheckResult(
-                    False, f"Failed to access Docker image URL: {docker_image_url}. Unknown error."
-                )
-            finally:
-                # Ensure the temporary docker image file is removed
-                if docker_image_path.exists():
-                    try:
-                        docker_image_path.unlink()
-                        logging.debug(f"Temporary Docker image file removed: {docker_image_path}")
-                    except OSError as e:
-                        logging.error(f"Failed to remove temporary Docker image file {docker_image_path}. Error: {e}")
+        try:
+            status, challenge = _head_manifest(manifest_url)
+            if status == 401 and challenge:
+                token = _fetch_bearer_token(challenge, repository, registry)
+                if token:
+                    status, _ = _head_manifest(manifest_url, token)
+        except (urllib.error.URLError, OSError) as e:
+            error_message = f"Failed to access Docker image URL: {docker_image_url}. Error: {e}"
+            logging.error(error_message)
+            return PrerequisiteCheckResult(False, error_message)
+
+        if status == 200:
+            logging.debug(f"Docker image URL, {docker_image_url}, is accessible. Manifest URL: {manifest_url}.")
+            return PrerequisiteCheckResult(True, f"Docker image URL, {docker_image_url}, is accessible.")
+        if status == 401:
+            detailed_message = (
+                f"Failed to access Docker image URL: {docker_image_url}. Error: 401 Unauthorized\n"
+                "This error indicates that access to the Docker image URL is unauthorized. "
+                "Please ensure you have the necessary permissions and have followed the "
+                "instructions in the README for setting up your credentials correctly."
+            )
+            logging.error(detailed_message)
+            return PrerequisiteCheckResult(False, detailed_message)
+        if status == 404:
+            error_message = f"Failed to access Docker image URL: {docker_image_url}. Error: 404 Not Found"
+            logging.error(error_message)
+            return PrerequisiteCheckResult(False, error_message)
+
+        logging.debug(f"Failed to access Docker image URL: {docker_image_url}. Unknown error (HTTP {status}).")
+        return PrerequisiteCheckResult(
+            False, f"Failed to access Docker image URL: {docker_image_url}. Unknown error (HTTP {status})."
+        )
 
     def uninstall_cached_image(self, subdir_name: str, docker_image_filename: str) -> DockerImageCacheResult:
         """
@@ -385,6 +617,8 @@ class DockerImageCacheManager:
         Returns:
             DockerImageCacheResult: Result of the uninstallation operation.
         """
+        _check_docker_image_exists.cache_clear()
+
         result = self.remove_cached_image(subdir_name, docker_image_filename)
         if not result.success:
             return result
@@ -416,7 +650,9 @@ class DockerImageCacheManager:
         Returns:
             DockerImageCacheResult: Result of the removal operation.
         """
-        docker_image_path = self.install_path / subdir_name / docker_image_filename
+        _check_docker_image_exists.cache_clear()
+
+        docker_image_path = self._cached_image_path(subdir_name, docker_image_filename)
         if docker_image_path.is_file():
             try:
                 docker_image_path.unlink()
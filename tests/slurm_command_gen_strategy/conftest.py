@@ -22,8 +22,9 @@ from cloudai.systems.slurm import SlurmNodeState
 from cloudai.systems.slurm.slurm_system import SlurmPartition
 
 
-@pytest.fixture
-def slurm_system(tmp_path: Path) -> SlurmSystem:
+@pytest.fixture(scope="module")
+def slurm_system(tmp_path_factory: pytest.TempPathFactory) -> SlurmSystem:
+    tmp_path = tmp_path_factory.mktemp("slurm_system")
     slurm_system = SlurmSystem(
         name="TestSystem",
         install_path=tmp_path / "install",
@@ -21,11 +21,12 @@ from cloudai.schema.test_template.chakra_replay.slurm_command_gen_strategy impor
 from cloudai.systems import SlurmSystem
 
 
-class TestChakraReplaySlurmCommandGenStrategy:
-    @pytest.fixture
-    def cmd_gen_strategy(self, slurm_system: SlurmSystem) -> ChakraReplaySlurmCommandGenStrategy:
-        return ChakraReplaySlurmCommandGenStrategy(slurm_system, {})
+@pytest.fixture(scope="class")
+def cmd_gen_strategy(slurm_system: SlurmSystem) -> ChakraReplaySlurmCommandGenStrategy:
+    return ChakraReplaySlurmCommandGenStrategy(slurm_system, {})
+
 
+class TestChakraReplaySlurmCommandGenStrategy:
     @pytest.mark.parametrize(
         "job_name_prefix, env_vars, cmd_args, num_nodes, nodes, expected_result",
         [
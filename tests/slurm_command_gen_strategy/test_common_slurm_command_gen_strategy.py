@@ -110,9 +110,10 @@ def test_only_nodes(strategy_fixture: SlurmCommandGenStrategy):
 
 
 def test_raises_if_no_default_partition(slurm_system: SlurmSystem):
-    slurm_system.default_partition = ""
+    # Copy instead of mutating the module-scoped fixture so other tests keep a valid system
+    system = slurm_system.model_copy(update={"default_partition": ""})
     with pytest.raises(ValueError) as exc_info:
-        SlurmCommandGenStrategy(slurm_system, {})
+        SlurmCommandGenStrategy(system, {})
     assert (
         "Default partition not set in the Slurm system object. "
         "The 'default_partition' attribute should be properly defined in the Slurm "
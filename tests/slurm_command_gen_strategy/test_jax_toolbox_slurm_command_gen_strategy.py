@@ -65,11 +65,13 @@ class TestJaxToolboxSlurmCommandGenStrategy:
         test_def.cmd_args.pre_test = PreTest(enable=True)
 
         test = Test(test_definition=test_def, test_template=JaxToolbox(slurm_system, "name"))
+        output_path = tmp_path / "output"
+        output_path.mkdir()
         test_run = TestRun(
             test=test,
             num_nodes=1,
             nodes=["node1"],
-            output_path=tmp_path / "output",
+            output_path=output_path,
             name="test-job",
         )
 
@@ -14,17 +14,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import base64
 import subprocess
+import urllib.error
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from cloudai.util.docker_image_cache_manager import (
     DockerImageCacheManager,
     DockerImageCacheResult,
     PrerequisiteCheckResult,
+    _check_docker_image_exists,
+    _fetch_bearer_token,
+    _parse_docker_image_url,
+    _which,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_module_caches():
+    """Start every test with cold memo caches so no test depends on state left by another."""
+    _check_docker_image_exists.cache_clear()
+    _which.cache_clear()
+
+
 @patch("pathlib.Path.is_file")
 @patch("pathlib.Path.exists")
 @patch("os.access")
@@ -67,16 +82,9 @@ def test_ensure_docker_image_url_cache_enabled(mock_access, mock_exists, mock_is
 def test_cache_docker_image(mock_check_prerequisites, mock_run, mock_access, mock_exists, mock_is_file):
     manager = DockerImageCacheManager(Path("/fake/install/path"), True, "default")
 
-    # Test when cached file already exists
-    mock_is_file.return_value = True
-    result = manager.cache_docker_image("docker.io/hello-world", "subdir", "image.tar.gz")
-    assert result.success
-    assert result.docker_image_path == Path("/fake/install/path/subdir/image.tar.gz")
-    assert result.message == "Cached Docker image already exists at /fake/install/path/subdir/image.tar.gz."
-
     # Test creating subdirectory when it doesn't exist
     mock_is_file.return_value = False
-    mock_exists.side_effect = [True, False, True]  # install_path exists, subdir_path does not, install_path again
+    mock_exists.side_effect = [True, True]  # install_path exists, subdir_path exists after mkdir
     result = manager.cache_docker_image("docker.io/hello-world", "subdir", "image.tar.gz")
     assert (manager.install_path / "subdir").exists(), "Subdirectory should exist after caching the image"
 
@@ -93,8 +101,16 @@ def test_cache_docker_image(mock_check_prerequisites, mock_run, mock_access, moc
     mock_run.return_value = subprocess.CompletedProcess(args=["cmd"], returncode=0, stderr="")
     result = manager.cache_docker_image("docker.io/hello-world", "subdir", "image.tar.gz")
     mock_run.assert_called_once_with(
-        "srun --export=ALL --partition=default enroot import -o /fake/install/path/subdir/image.tar.gz docker://docker.io/hello-world",
-        shell=True,
+        [
+            "srun",
+            "--export=ALL",
+            "--partition=default",
+            "enroot",
+            "import",
+            "-o",
+            "/fake/install/path/subdir/image.tar.gz",
+            "docker://docker.io/hello-world",
+        ],
         check=True,
         capture_output=True,
         text=True,
@@ -123,6 +139,62 @@ def test_cache_docker_image(mock_check_prerequisites, mock_run, mock_access, moc
     assert "Write error" in result.message
 
 
+def test_ensure_images_for_scenario_dedupes_images():
+    manager = DockerImageCacheManager(Path("/fake/install/path"), True, "default")
+
+    install_strategy = MagicMock()
+    install_strategy.docker_image_url = "docker.io/hello-world"
+    install_strategy.SUBDIR_PATH = "subdir"
+    install_strategy.DOCKER_IMAGE_FILENAME = "image.sqsh"
+    tr = MagicMock()
+    tr.test.test_template.install_strategy = install_strategy
+    test_scenario = MagicMock()
+    test_scenario.test_runs = [tr, tr, tr]
+
+    with patch.object(
+        manager,
+        "ensure_docker_image",
+        return_value=DockerImageCacheResult(True, Path("/fake/install/path/subdir/image.sqsh"), ""),
+    ) as mock_ensure:
+        results = manager.ensure_images_for_scenario(test_scenario)
+
+    # Three test runs sharing one image resolve it exactly once
+    mock_ensure.assert_called_once_with("docker.io/hello-world", "subdir", "image.sqsh")
+    assert results[("docker.io/hello-world", "subdir", "image.sqsh")].success
+
+
+def test_ensure_images_for_scenario_rejects_running_event_loop():
+    manager = DockerImageCacheManager(Path("/fake/install/path"), True, "default")
+
+    async def call_from_loop():
+        manager.ensure_images_for_scenario(MagicMock())
+
+    with pytest.raises(RuntimeError, match="cannot be called from a running event loop"):
+        asyncio.run(call_from_loop())
+
+
+@patch("pathlib.Path.is_file")
+@patch("pathlib.Path.exists")
+def test_check_docker_image_exists_is_memoized(mock_exists, mock_is_file):
+    manager = DockerImageCacheManager(Path("/fake/install/path"), True, "default")
+
+    mock_is_file.return_value = True
+    mock_exists.return_value = True
+    first = manager.check_docker_image_exists("/tmp/memoized_image.sqsh", "subdir", "memoized_image.sqsh")
+    assert first.success
+
+    # The second identical query is served from the memo without re-statting the filesystem
+    mock_is_file.return_value = False
+    second = manager.check_docker_image_exists("/tmp/memoized_image.sqsh", "subdir", "memoized_image.sqsh")
+    assert second.success
+    assert second.message == first.message
+
+    # Mutating methods invalidate the memo, so the check reflects the new filesystem state
+    manager.remove_cached_image("subdir", "memoized_image.sqsh")
+    third = manager.check_docker_image_exists("/tmp/memoized_image.sqsh", "subdir", "memoized_image.sqsh")
+    assert not third.success
+
+
 @patch("pathlib.Path.unlink")
 @patch("pathlib.Path.is_file")
 def test_remove_cached_image(mock_is_file, mock_unlink):
@@ -200,7 +272,7 @@ def test_uninstall_cached_image(mock_access, mock_iterdir, mock_exists, mock_is_
     patch.stopall()
 
 
-@patch("shutil.which")
+@patch("cloudai.util.docker_image_cache_manager._which")
 @patch("cloudai.util.docker_image_cache_manager.DockerImageCacheManager._check_docker_image_accessibility")
 def test_check_prerequisites(mock_check_docker_image_accessibility, mock_which):
     manager = DockerImageCacheManager(Path("/fake/install/path"), True, "default")
@@ -240,66 +312,110 @@ def test_check_prerequisites(mock_check_docker_image_accessibility, mock_which):
     assert "Docker image URL not accessible." in result.message
 
 
-@patch("subprocess.Popen")
-@patch("shutil.which")
-@patch("tempfile.TemporaryDirectory")
-def test_check_docker_image_accessibility_with_enroot(mock_tempdir, mock_which, mock_popen):
+@patch("urllib.request.urlopen")
+def test_check_docker_image_accessibility(mock_urlopen):
     manager = DockerImageCacheManager(Path("/fake/install/path"), True, "default")
 
-    # Ensure docker binary is not available
-    mock_which.return_value = None
-
-    # Mocking the TemporaryDirectory context manager
-    mock_temp_dir = MagicMock()
-    mock_tempdir.return_value.__enter__.return_value = mock_temp_dir
-    temp_dir_path = Path("/fake/temp/dir")
-    mock_temp_dir.__enter__.return_value = temp_dir_path
-
-    # Mock Popen for enroot command with success scenario
-    process_mock = MagicMock()
-    process_mock.stderr.readline.side_effect = [
-        b"Found all layers in cache\n",  # Simulate successful output
-        b"",
-        b"",
-    ]
-    process_mock.poll.side_effect = [None, None, 0]  # Simulate process running then finishing
+    def response_cm(response):
+        cm = MagicMock()
+        cm.__enter__.return_value = response
+        return cm
 
-    mock_popen.return_value = process_mock
+    # Accessible image: the manifest HEAD request returns 200
+    success_response = MagicMock()
+    success_response.status = 200
+    mock_urlopen.return_value = response_cm(success_response)
 
-    result = manager._check_docker_image_accessibility("docker.io/hello-world")
+    result = manager._check_docker_image_accessibility("nvcr.io/nvidia/pytorch:24.02")
     assert result.success
-    assert result.message == "Docker image URL, docker.io/hello-world, is accessible."
-
-    # Verify the command contains the required keywords
-    command = mock_popen.call_args[0][0]
-    assert "enroot import -o" in command
-    assert "docker://docker.io/hello-world" in command
-
-    # Mock Popen for enroot command with failure scenario
-    process_mock.reset_mock()
-    process_mock.stderr.readline.side_effect = [
-        b"[ERROR] URL https://nvcr.io/proxy_auth returned error code: 401 Unauthorized\n",  # Simulate 401 error output
-        b"",
-        b"",
-    ]
-    process_mock.poll.side_effect = [None, None, 0]  # Simulate process running then finishing
+    assert result.message == "Docker image URL, nvcr.io/nvidia/pytorch:24.02, is accessible."
+
+    request = mock_urlopen.call_args[0][0]
+    assert request.get_method() == "HEAD"
+    assert request.full_url == "https://nvcr.io/v2/nvidia/pytorch/manifests/24.02"
+
+    # 401 with a Bearer challenge: a pull token is fetched and the retry succeeds
+    challenge = 'Bearer realm="https://nvcr.io/proxy_auth",service="nvcr.io"'
+    unauthorized = urllib.error.HTTPError("url", 401, "Unauthorized", {"Www-Authenticate": challenge}, None)
+    token_response = MagicMock()
+    token_response.read.return_value = b'{"token": "fake-token"}'
+    mock_urlopen.reset_mock()
+    mock_urlopen.side_effect = [unauthorized, response_cm(token_response), response_cm(success_response)]
 
-    mock_popen.return_value = process_mock
+    result = manager._check_docker_image_accessibility("nvcr.io/nvidia/pytorch:24.02")
+    assert result.success
+
+    token_request = mock_urlopen.call_args_list[1][0][0]
+    assert token_request.full_url.startswith("https://nvcr.io/proxy_auth?")
+    assert "scope=repository%3Anvidia%2Fpytorch%3Apull" in token_request.full_url
+    retry_request = mock_urlopen.call_args_list[2][0][0]
+    assert retry_request.headers["Authorization"] == "Bearer fake-token"
 
-    result = manager._check_docker_image_accessibility("docker.io/hello-world")
+    # 401 that persists after the token retry is reported as a credentials problem
+    mock_urlopen.side_effect = [unauthorized, response_cm(token_response), unauthorized]
+    result = manager._check_docker_image_accessibility("nvcr.io/nvidia/pytorch:24.02")
     assert not result.success
     assert (
-        "Failed to access Docker image URL: docker.io/hello-world. "
-        "Error: [ERROR] URL https://nvcr.io/proxy_auth returned error code: 401 Unauthorized\n"
+        "Failed to access Docker image URL: nvcr.io/nvidia/pytorch:24.02. Error: 401 Unauthorized\n"
         "This error indicates that access to the Docker image URL is unauthorized. "
         "Please ensure you have the necessary permissions and have followed the instructions in the README "
         "for setting up your credentials correctly." in result.message.replace("\n\n", "\n")
     )
 
-    # Verify the command contains the required keywords
-    command = mock_popen.call_args[0][0]
-    assert "enroot import -o" in command
-    assert "docker://docker.io/hello-world" in command
+    # Missing image: the manifest HEAD request returns 404
+    mock_urlopen.side_effect = [urllib.error.HTTPError("url", 404, "Not Found", {}, None)]
+    result = manager._check_docker_image_accessibility("docker.io/no-such-image")
+    assert not result.success
+    assert result.message == "Failed to access Docker image URL: docker.io/no-such-image. Error: 404 Not Found"
+
+
+@patch("urllib.request.urlopen")
+def test_fetch_bearer_token_sends_enroot_credentials(mock_urlopen, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    credentials_file = tmp_path / ".credentials"
+    credentials_file.write_text("machine nvcr.io login $oauthtoken password fake-api-key\n")
+    monkeypatch.setenv("ENROOT_CONFIG_PATH", str(tmp_path))
+
+    token_response = MagicMock()
+    token_response.read.return_value = b'{"token": "fake-token"}'
+    cm = MagicMock()
+    cm.__enter__.return_value = token_response
+    mock_urlopen.return_value = cm
+
+    challenge = 'Bearer realm="https://nvcr.io/proxy_auth",service="nvcr.io"'
+    token = _fetch_bearer_token(challenge, "nvidia/private-image", "nvcr.io")
+    assert token == "fake-token"
+
+    token_request = mock_urlopen.call_args[0][0]
+    expected_basic = base64.b64encode(b"$oauthtoken:fake-api-key").decode()
+    assert token_request.headers["Authorization"] == f"Basic {expected_basic}"
+
+
+@patch("urllib.request.urlopen")
+def test_fetch_bearer_token_anonymous_without_credentials(
+    mock_urlopen, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    # Point at an empty config dir so any credentials on the host running the tests are ignored
+    monkeypatch.setenv("ENROOT_CONFIG_PATH", str(tmp_path))
+
+    token_response = MagicMock()
+    token_response.read.return_value = b'{"token": "anon-token"}'
+    cm = MagicMock()
+    cm.__enter__.return_value = token_response
+    mock_urlopen.return_value = cm
+
+    challenge = 'Bearer realm="https://nvcr.io/proxy_auth",service="nvcr.io"'
+    token = _fetch_bearer_token(challenge, "nvidia/pytorch", "nvcr.io")
+    assert token == "anon-token"
+
+    token_request = mock_urlopen.call_args[0][0]
+    assert "Authorization" not in token_request.headers
+
+
+def test_parse_docker_image_url():
+    assert _parse_docker_image_url("nvcr.io/nvidia/pytorch:24.02") == ("nvcr.io", "nvidia/pytorch", "24.02")
+    assert _parse_docker_image_url("docker.io/hello-world") == ("registry-1.docker.io", "library/hello-world", "latest")
+    assert _parse_docker_image_url("ubuntu:22.04") == ("registry-1.docker.io", "library/ubuntu", "22.04")
+    assert _parse_docker_image_url("localhost:5000/my/image:dev") == ("localhost:5000", "my/image", "dev")
 
 
 @patch("pathlib.Path.is_file")
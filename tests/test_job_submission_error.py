@@ -41,7 +41,9 @@ class MockCommandShell(CommandShell):
 
 class MockTest(Test):
     def __init__(self, section_name):
+        self.test_definition = MagicMock()
         self.test_template = MagicMock(spec=TestTemplate)
+        self.test_template.install_strategy = None
         self.test_template.get_job_id.return_value = None
         self.env_vars = {}
         self.section_name = "Tests.1"
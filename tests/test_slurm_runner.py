@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cloudai import TestTemplate
+from cloudai._core.test import Test
+from cloudai._core.test_scenario import TestRun, TestScenario
+from cloudai.runner.slurm.slurm_runner import SlurmRunner
+from cloudai.systems import SlurmSystem
+from cloudai.systems.slurm.slurm_system import SlurmPartition
+from cloudai.util.docker_image_cache_manager import DockerImageCacheManager
+
+
+@pytest.fixture
+def slurm_system(tmp_path: Path) -> SlurmSystem:
+    return SlurmSystem(
+        name="test_system",
+        install_path=tmp_path,
+        output_path=tmp_path,
+        default_partition="main",
+        partitions=[SlurmPartition(name="main", nodes=["nodeA001", "nodeB001"])],
+    )
+
+
+@pytest.fixture
+def test_scenario() -> TestScenario:
+    test_template = MagicMock(spec=TestTemplate)
+    test_template.install_strategy = None
+    test = Test(test_definition=MagicMock(), test_template=test_template)
+    return TestScenario(name="Test Scenario", test_runs=[TestRun("tr-name", test, 1, [])])
+
+
+@patch.object(DockerImageCacheManager, "ensure_images_for_scenario", return_value={})
+def test_run_mode_resolves_scenario_docker_images(mock_ensure, slurm_system: SlurmSystem, test_scenario: TestScenario):
+    SlurmRunner(mode="run", system=slurm_system, test_scenario=test_scenario)
+    mock_ensure.assert_called_once_with(test_scenario)
+
+
+@patch.object(DockerImageCacheManager, "ensure_images_for_scenario", return_value={})
+def test_dry_run_mode_skips_docker_image_resolution(
+    mock_ensure, slurm_system: SlurmSystem, test_scenario: TestScenario
+):
+    SlurmRunner(mode="dry-run", system=slurm_system, test_scenario=test_scenario)
+    mock_ensure.assert_not_called()